@@ -1,20 +1,186 @@
+import bisect
+import functools
 import json
 import math
 import os
 import queue
 import random
 import re
+import selectors
 import socket
+import string
 import threading
 import time
 import tkinter as tk
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from tkinter import filedialog, messagebox, ttk
 from difflib import SequenceMatcher
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional: fall back to difflib when rapidfuzz is not installed
+    fuzz = None
+    process = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to a substring scan when pyahocorasick is not installed
+    ahocorasick = None
 
 CONFIG_PATH = "config.json"
 VOTE_DURATION_SECONDS = 120
+FUZZY_MATCH_RATIO = 0.86
+PHRASE_BUCKET_SIZE = 4
+READ_BUFFER_SIZE = 16384
+SPIN_FRAME_MS = 16
+IDLE_POLL_MS = 100
+REFRESH_DEBOUNCE_MS = 50
+AUTOMATON_MIN_PHRASES = 256
+INPUT_DEBOUNCE_MS = 200
+
+_NORMALIZE_RE = re.compile(r"[^a-z0-9\s]")
+# Bytes _NORMALIZE_RE would strip from ASCII text, for the bytes.translate fast path.
+_ASCII_DROP = bytes(
+    code
+    for code in range(128)
+    if chr(code) not in string.ascii_lowercase + string.digits and not chr(code).isspace()
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_phrase(text: str) -> str:
+    lowered = text.lower()
+    if lowered.isascii():
+        filtered = lowered.encode("ascii").translate(None, _ASCII_DROP).decode("ascii")
+    else:
+        filtered = _NORMALIZE_RE.sub("", lowered)
+    return " ".join(filtered.split())
+
+
+class PhraseIndex:
+    # Known phrases bucketed by length, used to merge near-duplicate chat phrases.
+    def __init__(self, phrases: Iterable[str] = ()) -> None:
+        self._phrases: Dict[str, None] = {}
+        self._buckets: Dict[int, Set[str]] = defaultdict(set)
+        # The automaton (and the newline-joined copy of the phrases used for the reverse check)
+        # is not rebuilt on every change: phrases added since the last build are scanned
+        # directly, removed ones are filtered out of its hits, and it is rebuilt once those
+        # changes reach half the phrase count.
+        self._automaton: Any = None
+        self._joined = ""
+        self._joined_starts: List[int] = []
+        self._joined_phrases: List[str] = []
+        self._unindexed: Dict[str, None] = {}
+        self._removed_since_build = 0
+        for phrase in phrases:
+            self.add(phrase)
+
+    def __contains__(self, phrase: object) -> bool:
+        return phrase in self._phrases
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._phrases)
+
+    def add(self, phrase: str) -> None:
+        if phrase not in self._phrases:
+            self._phrases[phrase] = None
+            self._buckets[len(phrase) // PHRASE_BUCKET_SIZE].add(phrase)
+            if self._automaton is not None:
+                self._unindexed[phrase] = None
+
+    def discard(self, phrase: str) -> None:
+        if phrase not in self._phrases:
+            return
+        del self._phrases[phrase]
+        if phrase in self._unindexed:
+            del self._unindexed[phrase]
+        elif self._automaton is not None:
+            self._removed_since_build += 1
+        bucket = len(phrase) // PHRASE_BUCKET_SIZE
+        self._buckets[bucket].discard(phrase)
+        if not self._buckets[bucket]:
+            del self._buckets[bucket]
+
+    def match(self, phrase: str, ignore_phrase: str = "") -> Optional[str]:
+        if not phrase:
+            return None
+
+        if phrase != ignore_phrase and phrase in self._phrases:
+            return phrase
+
+        automaton = self._containment_automaton()
+        if automaton is None:
+            for existing in self._phrases:
+                if existing != ignore_phrase and (phrase in existing or existing in phrase):
+                    return existing
+        else:
+            # One automaton walk finds the indexed phrases contained in the new one, and one
+            # str.find pass over the joined phrases finds those containing it.
+            for _end, existing in automaton.iter(phrase):
+                if existing != ignore_phrase and existing in self._phrases:
+                    return existing
+            pos = self._joined.find(phrase)
+            while pos >= 0:
+                idx = bisect.bisect_right(self._joined_starts, pos) - 1
+                existing = self._joined_phrases[idx]
+                if existing != ignore_phrase and existing in self._phrases:
+                    return existing
+                if idx + 1 == len(self._joined_starts):
+                    break
+                pos = self._joined.find(phrase, self._joined_starts[idx + 1])
+            for existing in self._unindexed:
+                if existing != ignore_phrase and (phrase in existing or existing in phrase):
+                    return existing
+
+        # ratio() is 2*matches/(len_a+len_b), so only phrases of a similar length can
+        # reach the threshold; everything outside those length buckets is skipped.
+        length = len(phrase)
+        min_length = int(length * FUZZY_MATCH_RATIO / (2 - FUZZY_MATCH_RATIO))
+        max_length = int(length * (2 - FUZZY_MATCH_RATIO) / FUZZY_MATCH_RATIO) + 1
+        candidates = [
+            existing
+            for bucket in range(min_length // PHRASE_BUCKET_SIZE, max_length // PHRASE_BUCKET_SIZE + 1)
+            for existing in self._buckets.get(bucket, ())
+            if existing != ignore_phrase
+        ]
+
+        if process is not None:
+            match = process.extractOne(phrase, candidates, scorer=fuzz.ratio, score_cutoff=FUZZY_MATCH_RATIO * 100)
+            return match[0] if match else None
+
+        for existing in candidates:
+            matcher = SequenceMatcher(None, phrase, existing)
+            if (
+                matcher.real_quick_ratio() >= FUZZY_MATCH_RATIO
+                and matcher.quick_ratio() >= FUZZY_MATCH_RATIO
+                and matcher.ratio() >= FUZZY_MATCH_RATIO
+            ):
+                return existing
+
+        return None
+
+    def _containment_automaton(self) -> Any:
+        if ahocorasick is None or len(self._phrases) < AUTOMATON_MIN_PHRASES:
+            return None
+        if self._automaton is None or len(self._unindexed) + self._removed_since_build > len(self._phrases) // 2:
+            automaton = ahocorasick.Automaton()
+            for phrase in self._phrases:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._automaton = automaton
+            # Normalized phrases never contain a newline, so a find() hit lies inside one phrase.
+            self._joined_phrases = list(self._phrases)
+            self._joined_starts = []
+            start = 0
+            for phrase in self._joined_phrases:
+                self._joined_starts.append(start)
+                start += len(phrase) + 1
+            self._joined = "\n".join(self._joined_phrases)
+            self._unindexed.clear()
+            self._removed_since_build = 0
+        return self._automaton
 
 
 @dataclass
@@ -42,9 +208,15 @@ class TwitchIRCClient(threading.Thread):
         self.on_error = on_error
         self._stop_event = threading.Event()
         self.sock: Optional[socket.socket] = None
+        # stop() writes to _wake_w so the reader blocked in select() returns immediately.
+        self._wake_r, self._wake_w = socket.socketpair()
 
     def stop(self) -> None:
         self._stop_event.set()
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
         if self.sock:
             try:
                 self.sock.close()
@@ -60,56 +232,84 @@ class TwitchIRCClient(threading.Thread):
             self.sock.send(f"PASS {self.oauth_token}\r\n".encode("utf-8"))
             self.sock.send(f"NICK {self.nickname}\r\n".encode("utf-8"))
             self.sock.send(f"JOIN #{self.channel}\r\n".encode("utf-8"))
-            self.sock.settimeout(1)
 
             self.on_status(f"Connected to #{self.channel} as {self.nickname}")
-            read_buffer = ""
-
-            while not self._stop_event.is_set():
-                try:
-                    data = self.sock.recv(2048)
-                    if not data:
-                        self.on_error("Connection closed by server.")
-                        break
-                    read_buffer += data.decode("utf-8", errors="ignore")
-                except socket.timeout:
-                    continue
-                except OSError as exc:
-                    if not self._stop_event.is_set():
-                        self.on_error(f"Socket error: {exc}")
-                    break
-
-                while "\r\n" in read_buffer:
-                    line, read_buffer = read_buffer.split("\r\n", 1)
-                    if not line:
-                        continue
-                    if line.startswith("PING"):
-                        self.sock.send("PONG :tmi.twitch.tv\r\n".encode("utf-8"))
-                        continue
-                    if "PRIVMSG" in line:
-                        username, message = self._parse_privmsg(line)
-                        if username and message:
-                            self.on_chat(username, message)
+            selector = selectors.DefaultSelector()
+            selector.register(self.sock, selectors.EVENT_READ)
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            try:
+                self._read_loop(selector)
+            finally:
+                selector.close()
         except Exception as exc:  # network/parsing hard fail
             self.on_error(f"Failed to connect/read Twitch chat: {exc}")
+        finally:
+            self._wake_r.close()
+            self._wake_w.close()
+
+    def _read_loop(self, selector: selectors.BaseSelector) -> None:
+        buf = bytearray(READ_BUFFER_SIZE)
+        view = memoryview(buf)
+        filled = 0
+
+        while not self._stop_event.is_set():
+            if filled == len(buf):
+                # A single line outgrew the buffer; grow it instead of dropping data.
+                view.release()
+                buf.extend(bytes(len(buf)))
+                view = memoryview(buf)
+
+            # Sleep until chat arrives or stop() wakes us; no periodic polling.
+            ready = selector.select()
+            if self._stop_event.is_set():
+                break
+            if not any(key.fileobj is self.sock for key, _events in ready):
+                continue
+
+            try:
+                received = self.sock.recv_into(view[filled:])
+                if not received:
+                    self.on_error("Connection closed by server.")
+                    break
+            except socket.timeout:
+                continue
+            except OSError as exc:
+                if not self._stop_event.is_set():
+                    self.on_error(f"Socket error: {exc}")
+                break
+
+            end = filled + received
+            start = 0
+            while True:
+                newline = buf.find(b"\r\n", start, end)
+                if newline < 0:
+                    break
+                line = bytes(view[start:newline])
+                start = newline + 2
+                if not line:
+                    continue
+                if line.startswith(b"PING"):
+                    self.sock.send(b"PONG :tmi.twitch.tv\r\n")
+                    continue
+                if b"PRIVMSG" in line:
+                    username, message = self._parse_privmsg(line.decode("utf-8", errors="ignore"))
+                    if username and message:
+                        self.on_chat(username, message)
+
+            filled = end - start
+            if start and filled:
+                buf[:filled] = buf[start:end]
 
     @staticmethod
     def _parse_privmsg(raw_line: str) -> Tuple[str, str]:
-        try:
-            if "PRIVMSG" not in raw_line or "!" not in raw_line:
-                return "", ""
-
-            username = raw_line.split("!", 1)[0].lstrip(":").strip()
-            parts = raw_line.split(" PRIVMSG ", 1)
-            if len(parts) != 2:
-                return "", ""
-            tail = parts[1]
-            msg_split = tail.split(" :", 1)
-            if len(msg_split) != 2:
-                return "", ""
-            return username, msg_split[1].strip()
-        except Exception:
+        # :nick!user@host PRIVMSG #channel :message
+        bang = raw_line.find("!")
+        command = raw_line.find(" PRIVMSG ", bang)
+        colon = raw_line.find(" :", command + 9)
+        if bang < 0 or command < 0 or colon < 0:
             return "", ""
+        start = 1 if raw_line.startswith(":") else 0
+        return raw_line[start:bang].strip(), raw_line[colon + 2 :].strip()
 
 
 class WheelCanvas(tk.Canvas):
@@ -132,22 +332,64 @@ class WheelCanvas(tk.Canvas):
         self.entries: Dict[str, int] = {}
         self.current_phrase = ""
         self.current_voted_by = ""
+        # (phrase, votes, start offset, extent, color, cos(mid angle), sin(mid angle))
+        self._segments: List[Tuple[str, int, float, float, str, float, float]] = []
+        self._total = 0
+        self._cum_extents: List[float] = []
+        self._arc_ids: List[int] = []
+        self._label_ids: List[int] = []
+        # Fonts, sizes, text and colours are only pushed to Tk when the segments, canvas size or
+        # info text change; a spinning frame only moves arcs and labels.
+        self._segments_changed = True
+        self._layout: Optional[Tuple[int, int]] = None
+        self._shown_info: Optional[Tuple[str, str]] = None
+        self._empty_id = self.create_text(0, 0, text="No wheel segments yet", fill="white", tags="overlay")
+        self._phrase_id = self.create_text(0, 0, fill="#00ff66", tags="overlay")
+        self._voter_id = self.create_text(0, 0, fill="#00ff66", tags="overlay")
+        self._pointer_id = self.create_polygon(0, 0, 0, 0, 0, 0, fill="white", outline="white", tags="overlay")
 
     def set_entries(self, entries: Dict[str, int]) -> None:
-        self.entries = {k: v for k, v in entries.items() if v > 0}
+        entries = {k: v for k, v in entries.items() if v > 0}
+        # Compare as item lists: segment order is part of the layout, dict equality ignores it.
+        if list(entries.items()) == list(self.entries.items()):
+            return
+        self.entries = entries
+        self._total = sum(self.entries.values())
+        self._segments = []
+        self._cum_extents = []
+        offset = 0.0
+        for idx, (phrase, votes) in enumerate(self.entries.items()):
+            extent = 360.0 * (votes / self._total)
+            mid = math.radians(offset + extent / 2)
+            color = self.COLORS[idx % len(self.COLORS)]
+            self._segments.append((phrase, votes, offset, extent, color, math.cos(mid), math.sin(mid)))
+            offset += extent
+            self._cum_extents.append(offset)
+        self._segments_changed = True
         self.draw_wheel()
 
+    def segment_at(self, angle: float) -> Optional[Tuple[str, int, float, float]]:
+        if not self._segments:
+            return None
+        idx = min(bisect.bisect_right(self._cum_extents, angle), len(self._segments) - 1)
+        phrase, votes, offset, extent = self._segments[idx][:4]
+        return phrase, votes, offset, extent
+
     def set_rotation(self, rotation: float) -> None:
-        self.rotation = rotation % 360
+        rotation %= 360
+        if abs(rotation - self.rotation) < 0.01:
+            return
+        self.rotation = rotation
         self.draw_wheel()
 
     def set_current_info(self, phrase: str, voted_by: str) -> None:
+        if (phrase, voted_by) == (self.current_phrase, self.current_voted_by):
+            return
         self.current_phrase = phrase
         self.current_voted_by = voted_by
         self.draw_wheel()
 
     def draw_wheel(self) -> None:
-        self.delete("all")
         width = max(1, self.winfo_width())
         height = max(1, self.winfo_height())
 
@@ -158,73 +400,79 @@ class WheelCanvas(tk.Canvas):
         radius = min(width * 0.45, (height - bottom_label_margin - pointer_margin) * 0.5)
         radius = max(40, radius)
 
-        total_votes = sum(self.entries.values())
-        if total_votes <= 0:
-            self.create_text(
-                cx,
-                cy,
-                text="No wheel segments yet",
-                fill="white",
-                font=("Arial", max(12, int(height * 0.035)), "bold"),
-            )
-        else:
-            start_angle = self.rotation
-            for idx, (phrase, votes) in enumerate(self.entries.items()):
-                extent = 360.0 * (votes / total_votes)
-                color = self.COLORS[idx % len(self.COLORS)]
-                self.create_arc(
-                    cx - radius,
-                    cy - radius,
-                    cx + radius,
-                    cy + radius,
-                    start=start_angle,
-                    extent=extent,
-                    fill=color,
-                    outline="black",
-                    width=2,
-                )
-
-                label_angle = math.radians(start_angle + extent / 2)
-                tx = cx + math.cos(label_angle) * (radius * 0.6)
-                ty = cy - math.sin(label_angle) * (radius * 0.6)
-                self.create_text(
-                    tx,
-                    ty,
-                    text=f"{phrase}\n({votes})",
-                    fill="white",
-                    font=("Arial", max(8, int(height * 0.014)), "bold"),
-                    width=max(80, int(width * 0.22)),
-                    justify="center",
-                )
-                start_angle += extent
-
-        if self.current_phrase:
-            phrase_y = height - max(52, int(height * 0.10))
-            voter_y = height - max(22, int(height * 0.045))
-            self.create_text(
-                cx,
-                phrase_y,
-                text=self.current_phrase,
-                fill="#00ff66",
-                font=("Arial", max(15, int(height * 0.035)), "bold"),
-            )
-            self.create_text(
-                cx,
-                voter_y,
-                text=self.current_voted_by,
-                fill="#00ff66",
-                font=("Arial", max(11, int(height * 0.024)), "bold"),
-            )
+        # Canvas items are reused across frames; they are only recreated when the segment count changes.
+        if len(self._arc_ids) != len(self._segments):
+            self._rebuild_segment_items()
+
+        if self._segments_changed or self._layout != (width, height):
+            self._segments_changed = False
+            self._layout = (width, height)
+            self._shown_info = None
+            self._restyle(width, height, cx, cy, radius, pointer_margin)
+
+        # Label positions rotate the pre-baked segment midpoints by self.rotation.
+        rotation = math.radians(self.rotation)
+        cos_rot = math.cos(rotation)
+        sin_rot = math.sin(rotation)
+        label_radius = radius * 0.6
+        for arc_id, label_id, segment in zip(self._arc_ids, self._label_ids, self._segments):
+            offset, cos_mid, sin_mid = segment[2], segment[5], segment[6]
+            self.itemconfigure(arc_id, start=self.rotation + offset)
+            tx = cx + (cos_mid * cos_rot - sin_mid * sin_rot) * label_radius
+            ty = cy - (sin_mid * cos_rot + cos_mid * sin_rot) * label_radius
+            self.coords(label_id, tx, ty)
+
+        info = (self.current_phrase, self.current_voted_by)
+        if info != self._shown_info:
+            self._shown_info = info
+            info_state = "normal" if self.current_phrase else "hidden"
+            self.itemconfigure(self._phrase_id, text=self.current_phrase, state=info_state)
+            self.itemconfigure(self._voter_id, text=self.current_voted_by, state=info_state)
+
+    def _restyle(self, width: int, height: int, cx: float, cy: float, radius: float, pointer_margin: int) -> None:
+        self.coords(self._empty_id, cx, cy)
+        self.itemconfigure(
+            self._empty_id,
+            state="hidden" if self._total > 0 else "normal",
+            font=("Arial", max(12, int(height * 0.035)), "bold"),
+        )
+
+        label_font = ("Arial", max(8, int(height * 0.014)), "bold")
+        label_width = max(80, int(width * 0.22))
+        for arc_id, label_id, segment in zip(self._arc_ids, self._label_ids, self._segments):
+            phrase, votes, _offset, extent, color = segment[:5]
+            self.coords(arc_id, cx - radius, cy - radius, cx + radius, cy + radius)
+            self.itemconfigure(arc_id, extent=extent, fill=color)
+            self.itemconfigure(label_id, text=f"{phrase}\n({votes})", font=label_font, width=label_width)
+
+        self.coords(self._phrase_id, cx, height - max(52, int(height * 0.10)))
+        self.itemconfigure(self._phrase_id, font=("Arial", max(15, int(height * 0.035)), "bold"))
+        self.coords(self._voter_id, cx, height - max(22, int(height * 0.045)))
+        self.itemconfigure(self._voter_id, font=("Arial", max(11, int(height * 0.024)), "bold"))
 
         pointer_half_width = max(6, radius * 0.035)
         pointer_top = pointer_margin
         pointer_tip = pointer_top + max(12, radius * 0.09)
-        self.create_polygon(
-            [cx - pointer_half_width, pointer_top, cx + pointer_half_width, pointer_top, cx, pointer_tip],
-            fill="white",
-            outline="white",
+        self.coords(
+            self._pointer_id,
+            cx - pointer_half_width,
+            pointer_top,
+            cx + pointer_half_width,
+            pointer_top,
+            cx,
+            pointer_tip,
         )
 
+    def _rebuild_segment_items(self) -> None:
+        for item_id in self._arc_ids + self._label_ids:
+            self.delete(item_id)
+        self._arc_ids = []
+        self._label_ids = []
+        for _segment in self._segments:
+            self._arc_ids.append(self.create_arc(0, 0, 0, 0, outline="black", width=2))
+            self._label_ids.append(self.create_text(0, 0, fill="white", justify="center"))
+        self.tag_raise("overlay")
+
 
 class App:
     def __init__(self, root: tk.Tk) -> None:
@@ -240,18 +488,40 @@ class App:
         self.spinning = False
         self.rotation = 0.0
         self.spin_velocity = 0.0
-        self.vote_counts: Dict[str, int] = {}
+        self._wheel_dirty = True
+        self.vote_counts: Counter[str] = Counter()
         self.user_votes: Dict[str, str] = {}
+        self._users_by_phrase: Dict[str, List[str]] = {}
+        self._phrase_index = PhraseIndex()
+        self._votes_version = 0
+        self._sorted_all_votes: List[Tuple[str, int]] = []
+        self._sorted_votes_version = -1
+        self._cached_top: Tuple[int, int, Dict[str, int]] = (-1, 0, {})
+        self._tree_items: Dict[str, str] = {}
+        self._tree_votes: Dict[str, int] = {}
+        self._tree_order: List[str] = []
+        self._refresh_after_id: Optional[str] = None
+        self._max_phrases_after_id: Optional[str] = None
 
         self.irc_client: Optional[TwitchIRCClient] = None
 
+        # Normalizing and fuzzy-matching chat runs on a worker thread against a snapshot of the
+        # phrase list; the Tk thread only applies the resulting (username, phrase) votes.
+        self._vote_in: "queue.Queue[Optional[Tuple[int, str, str]]]" = queue.Queue()
+        self._vote_out: "queue.Queue[Tuple[int, str, str]]" = queue.Queue()
+        self._vote_generation = 0
+        self._votes_applied = 0
+        self._phrase_snapshot: Tuple[int, int, Tuple[str, ...]] = (0, 0, ())
+        self._vote_thread = threading.Thread(target=self._vote_worker, daemon=True)
+        self._vote_thread.start()
+
         self._build_main_window()
         self._build_wheel_window()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.after(100, self.process_events)
         self.root.after(250, self.update_timer)
-        self.root.after(16, self.update_spin_state)
+        self.root.after(SPIN_FRAME_MS, self.update_spin_state)
 
         self.connect_chat()
 
@@ -341,7 +611,11 @@ class App:
 
         self.wheel_canvas = WheelCanvas(self.wheel_window)
         self.wheel_canvas.pack(fill="both", expand=True)
-        self.wheel_canvas.bind("<Configure>", lambda _e: self.wheel_canvas.draw_wheel())
+        self.wheel_canvas.bind("<Configure>", self.on_wheel_configure)
+
+    def on_wheel_configure(self, _event: tk.Event) -> None:
+        self.wheel_canvas.draw_wheel()
+        self._wheel_dirty = True
 
     def connect_chat(self) -> None:
         channel = self.config.get("channel", "itskxtlyn")
@@ -372,6 +646,21 @@ class App:
         self.chat_text.configure(state="disabled")
 
     def process_events(self) -> None:
+        # Drain the whole queue first so a chat flood costs one log write and one refresh.
+        votes_changed = False
+        while True:
+            try:
+                generation, username, target_phrase = self._vote_out.get_nowait()
+            except queue.Empty:
+                break
+            self._votes_applied += 1
+            if generation == self._vote_generation:
+                votes_changed = self._apply_vote(username, target_phrase) or votes_changed
+
+        if self._phrase_snapshot[0] != self._votes_version:
+            self._phrase_snapshot = (self._votes_version, self._votes_applied, tuple(self.vote_counts))
+
+        chat_lines: List[str] = []
         while True:
             try:
                 event = self.event_queue.get_nowait()
@@ -380,118 +669,201 @@ class App:
 
             if event.kind == "chat":
                 username, message = event.payload
-                self.log_chat(f"[{username}] {message}")
-                self.consume_vote(username, message)
+                chat_lines.append(f"[{username}] {message}")
+                username = username.strip().lower()
+                if self.voting_active and username:
+                    self._vote_in.put((self._vote_generation, username, message))
             elif event.kind == "status":
                 self.set_status(event.payload)
             elif event.kind == "error":
                 self.set_status(event.payload, error=True)
-                self.log_chat(f"[ERROR] {event.payload}")
+                chat_lines.append(f"[ERROR] {event.payload}")
 
-        self.root.after(100, self.process_events)
+        if chat_lines:
+            self.log_chat("\n".join(chat_lines))
+        if votes_changed:
+            self.request_refresh()
 
-    @staticmethod
-    def normalize_phrase(text: str) -> str:
-        lowered = " ".join(text.strip().lower().split())
-        return re.sub(r"[^a-z0-9\s]", "", lowered).strip()
-
-    def find_matching_phrase(self, phrase: str, ignore_phrase: str = "") -> Optional[str]:
-        if not phrase:
-            return None
+        self.root.after(100, self.process_events)
 
-        for existing in self.vote_counts:
-            if ignore_phrase and existing == ignore_phrase:
+    def _vote_worker(self) -> None:
+        current_generation = self._vote_generation
+        version = -1
+        index = PhraseIndex()
+        produced = 0
+        # New phrases this worker created that the Tk thread had not applied at the last snapshot.
+        pending: List[Tuple[int, str]] = []
+        while True:
+            item = self._vote_in.get()
+            if item is None:
+                return
+            generation, username, message = item
+            phrase = normalize_phrase(message)
+            if not phrase:
                 continue
 
-            if phrase == existing:
-                return existing
-
-            if phrase in existing or existing in phrase:
-                return existing
-
-            ratio = SequenceMatcher(None, phrase, existing).ratio()
-            if ratio >= 0.86:
-                return existing
+            if generation != current_generation:
+                # A clear/import discarded every older vote, including phrases still pending here.
+                # process_events publishes the post-clear snapshot before queueing new-generation votes.
+                current_generation = generation
+                version = -1
+                pending = []
+
+            snapshot_version, applied, phrases = self._phrase_snapshot
+            if snapshot_version != version:
+                version = snapshot_version
+                pending = [(seq, pending_phrase) for seq, pending_phrase in pending if seq > applied]
+                # Sync the existing index with the snapshot instead of rebuilding it, so its
+                # automaton (if any) survives the per-tick snapshots.
+                known = set(phrases)
+                known.update(pending_phrase for _seq, pending_phrase in pending)
+                for stale_phrase in [existing for existing in index if existing not in known]:
+                    index.discard(stale_phrase)
+                for known_phrase in phrases:
+                    index.add(known_phrase)
+
+            produced += 1
+            target_phrase = index.match(phrase)
+            if target_phrase is None:
+                target_phrase = phrase
+                index.add(phrase)
+                pending.append((produced, phrase))
+            self._vote_out.put((generation, username, target_phrase))
 
-        return None
+    def find_matching_phrase(self, phrase: str, ignore_phrase: str = "") -> Optional[str]:
+        return self._phrase_index.match(phrase, ignore_phrase)
 
-    def consume_vote(self, username: str, message: str) -> None:
-        if not self.voting_active:
+    def _set_phrase_votes(self, phrase: str, votes: int) -> None:
+        if votes <= 0:
+            self._drop_phrase(phrase)
             return
+        self._phrase_index.add(phrase)
+        self.vote_counts[phrase] = votes
+        self._votes_version += 1
 
-        username = username.strip().lower()
-        if not username:
+    def _drop_phrase(self, phrase: str) -> None:
+        if self.vote_counts.pop(phrase, None) is None:
             return
+        self._votes_version += 1
+        self._phrase_index.discard(phrase)
 
-        phrase = self.normalize_phrase(message)
-        if not phrase:
-            return
-
-        matched_phrase = self.find_matching_phrase(phrase)
-        target_phrase = matched_phrase or phrase
+    def _rebuild_phrase_index(self) -> None:
+        self._votes_version += 1
+        self._phrase_index = PhraseIndex(self.vote_counts)
 
+    def _apply_vote(self, username: str, target_phrase: str) -> bool:
         previous_phrase = self.user_votes.get(username)
         if previous_phrase == target_phrase:
-            return
+            return False
 
-        if previous_phrase:
-            if previous_phrase in self.vote_counts:
-                self.vote_counts[previous_phrase] -= 1
-                if self.vote_counts[previous_phrase] <= 0:
-                    self.vote_counts.pop(previous_phrase, None)
+        if previous_phrase and previous_phrase in self.vote_counts:
+            self._set_phrase_votes(previous_phrase, self.vote_counts[previous_phrase] - 1)
 
-        self.vote_counts[target_phrase] = self.vote_counts.get(target_phrase, 0) + 1
-        self.user_votes[username] = target_phrase
-        self.refresh_table_from_votes()
+        self._set_phrase_votes(target_phrase, self.vote_counts[target_phrase] + 1)
+        self._set_user_vote(username, target_phrase)
+        return True
+
+    def _set_user_vote(self, username: str, phrase: str) -> None:
+        previous_phrase = self.user_votes.get(username)
+        if previous_phrase is not None:
+            users = self._users_by_phrase.get(previous_phrase, [])
+            idx = bisect.bisect_left(users, username)
+            if idx < len(users) and users[idx] == username:
+                del users[idx]
+                if not users:
+                    del self._users_by_phrase[previous_phrase]
+        self.user_votes[username] = phrase
+        bisect.insort(self._users_by_phrase.setdefault(phrase, []), username)
+
+    def _rebuild_user_index(self) -> None:
+        self._users_by_phrase.clear()
+        for username, phrase in sorted(self.user_votes.items()):
+            self._users_by_phrase.setdefault(phrase, []).append(username)
+
+    def _sorted_votes(self) -> List[Tuple[str, int]]:
+        if self._sorted_votes_version != self._votes_version:
+            self._sorted_all_votes = sorted(self.vote_counts.items(), key=lambda x: (-x[1], x[0]))
+            self._sorted_votes_version = self._votes_version
+        return self._sorted_all_votes
 
     def get_top_votes(self) -> Dict[str, int]:
         max_phrases = max(1, self.safe_int(self.max_phrases_var.get(), 10))
-        return dict(sorted(self.vote_counts.items(), key=lambda x: (-x[1], x[0]))[:max_phrases])
+        version, cached_max, top_votes = self._cached_top
+        if version == self._votes_version and cached_max == max_phrases:
+            return top_votes
+        top_votes = dict(self._sorted_votes()[:max_phrases])
+        self._cached_top = (self._votes_version, max_phrases, top_votes)
+        return top_votes
 
     def on_top_phrases_changed(self, *_args: Any) -> None:
+        # Wait for typing to settle so "100" is one refresh, not three.
+        if self._max_phrases_after_id is not None:
+            self.root.after_cancel(self._max_phrases_after_id)
+        self._max_phrases_after_id = self.root.after(INPUT_DEBOUNCE_MS, self._apply_top_phrases)
+
+    def _apply_top_phrases(self) -> None:
+        self._max_phrases_after_id = None
         self.refresh_table_from_votes()
 
     def pointer_details(self) -> Tuple[str, str]:
-        top_votes = self.get_top_votes()
-        total = sum(top_votes.values())
-        if total <= 0:
-            return "", ""
-
         pointer_angle = 90.0
         wheel_angle = (pointer_angle - (self.rotation % 360)) % 360
 
-        running = 0.0
-        for phrase, votes in top_votes.items():
-            extent = 360.0 * (votes / total)
-            if running <= wheel_angle < running + extent:
-                phrase_users = sorted(username for username, user_phrase in self.user_votes.items() if user_phrase == phrase)
-                voter_slots = phrase_users[:votes]
-                if len(voter_slots) < votes:
-                    missing = votes - len(voter_slots)
-                    voter_slots.extend([f"unknown-{i + 1}" for i in range(missing)])
+        segment = self.wheel_canvas.segment_at(wheel_angle)
+        if segment is None:
+            return "", ""
+        phrase, votes, running, extent = segment
+
+        voter_slots = self._users_by_phrase.get(phrase, [])[:votes]
+        if len(voter_slots) < votes:
+            missing = votes - len(voter_slots)
+            voter_slots.extend([f"unknown-{i + 1}" for i in range(missing)])
 
-                if not voter_slots:
-                    return phrase, "voted by: -"
+        if not voter_slots:
+            return phrase, "voted by: -"
 
-                local_angle = wheel_angle - running
-                slot_extent = extent / len(voter_slots)
-                slot_idx = min(len(voter_slots) - 1, int(local_angle / slot_extent))
-                return phrase, f"voted by: {voter_slots[slot_idx]}"
-            running += extent
+        local_angle = wheel_angle - running
+        slot_extent = extent / len(voter_slots)
+        slot_idx = min(len(voter_slots) - 1, int(local_angle / slot_extent))
+        return phrase, f"voted by: {voter_slots[slot_idx]}"
 
-        fallback_phrase = next(iter(top_votes), "")
-        return fallback_phrase, "voted by: -"
+    def request_refresh(self) -> None:
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.root.after(REFRESH_DEBOUNCE_MS, self.refresh_table_from_votes)
 
     def refresh_table_from_votes(self) -> None:
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        all_votes = dict(self._sorted_votes())
         top_votes = self.get_top_votes()
-        all_votes = dict(sorted(self.vote_counts.items(), key=lambda x: (-x[1], x[0])))
+        self._sync_tree(all_votes)
+        self.wheel_canvas.set_entries(top_votes)
+        self._wheel_dirty = True
+
+    def _sync_tree(self, all_votes: Dict[str, int]) -> None:
+        for phrase in [p for p in self._tree_items if p not in all_votes]:
+            self.tree.delete(self._tree_items.pop(phrase))
+            del self._tree_votes[phrase]
+        order = [phrase for phrase in self._tree_order if phrase in all_votes]
 
-        self.tree.delete(*self.tree.get_children())
         for phrase, votes in all_votes.items():
-            self.tree.insert("", "end", values=(phrase, votes))
-        self.wheel_canvas.set_entries(top_votes)
-        current_phrase, current_voter = self.pointer_details()
-        self.wheel_canvas.set_current_info(current_phrase, current_voter)
+            item_id = self._tree_items.get(phrase)
+            if item_id is None:
+                self._tree_items[phrase] = self.tree.insert("", "end", values=(phrase, votes))
+                order.append(phrase)
+            elif self._tree_votes[phrase] != votes:
+                self.tree.set(item_id, "votes", votes)
+            self._tree_votes[phrase] = votes
+
+        # Only move rows that are out of place; a vote usually shifts a single phrase.
+        for idx, phrase in enumerate(all_votes):
+            if order[idx] != phrase:
+                self.tree.move(self._tree_items[phrase], "", idx)
+                order.remove(phrase)
+                order.insert(idx, phrase)
+        self._tree_order = order
 
     def start_vote(self) -> None:
         self.voting_active = True
@@ -501,8 +873,11 @@ class App:
     def clear_vote(self) -> None:
         self.voting_active = False
         self.vote_end_at = 0
+        self._vote_generation += 1
         self.vote_counts.clear()
         self.user_votes.clear()
+        self._users_by_phrase.clear()
+        self._rebuild_phrase_index()
         self.refresh_table_from_votes()
         self.timer_var.set("Voting idle")
 
@@ -523,21 +898,16 @@ class App:
         self.root.after(250, self.update_timer)
 
     def add_or_update_segment(self) -> None:
-        phrase = self.normalize_phrase(self.new_phrase.get())
+        phrase = normalize_phrase(self.new_phrase.get())
         votes = self.safe_int(self.new_votes.get(), 1)
         if not phrase:
             return
 
         matched_phrase = self.find_matching_phrase(phrase)
         if matched_phrase and matched_phrase != phrase:
-            self.vote_counts[matched_phrase] = max(0, self.vote_counts.get(matched_phrase, 0) + votes)
-            target_phrase = matched_phrase
+            self._set_phrase_votes(matched_phrase, self.vote_counts[matched_phrase] + votes)
         else:
-            self.vote_counts[phrase] = max(0, votes)
-            target_phrase = phrase
-
-        if self.vote_counts.get(target_phrase, 0) <= 0:
-            self.vote_counts.pop(target_phrase, None)
+            self._set_phrase_votes(phrase, votes)
         self.refresh_table_from_votes()
         self.new_phrase.set("")
 
@@ -547,7 +917,7 @@ class App:
             return
         for item in selection:
             phrase = self.tree.item(item, "values")[0]
-            self.vote_counts.pop(phrase, None)
+            self._drop_phrase(phrase)
         self.refresh_table_from_votes()
 
     def export_segments(self) -> None:
@@ -584,7 +954,7 @@ class App:
         if not path:
             return
 
-        imported: Dict[str, int] = {}
+        raw_counts: Counter[str] = Counter()
         imported_user_votes: Dict[str, str] = {}
 
         try:
@@ -597,48 +967,59 @@ class App:
                     parts = line.split("\t")
 
                     if len(parts) >= 3 and parts[0] == "SEGMENT":
-                        phrase = self.normalize_phrase(parts[1])
+                        phrase = normalize_phrase(parts[1])
                         votes = self.safe_int(parts[2].strip(), 0)
                         if phrase and votes > 0:
-                            existing = self.find_matching_phrase(phrase)
-                            target = existing or phrase
-                            imported[target] = imported.get(target, 0) + votes
+                            raw_counts[phrase] += votes
                         continue
 
                     if len(parts) >= 3 and parts[0] == "USERVOTE":
                         username = parts[1].strip().lower()
-                        phrase = self.normalize_phrase(parts[2])
+                        phrase = normalize_phrase(parts[2])
                         if username and phrase:
                             imported_user_votes[username] = phrase
                         continue
 
-                    if "	" in line:
-                        phrase_raw, votes_raw = line.rsplit("	", 1)
+                    if len(parts) > 1:
+                        phrase_raw, votes_raw = " ".join(parts[:-1]), parts[-1]
                     else:
                         legacy = line.rsplit(" ", 1)
                         if len(legacy) != 2:
                             continue
                         phrase_raw, votes_raw = legacy
 
-                    phrase = self.normalize_phrase(phrase_raw)
+                    phrase = normalize_phrase(phrase_raw)
                     votes = self.safe_int(votes_raw.strip(), 0)
                     if not phrase or votes <= 0:
                         continue
-
-                    existing = self.find_matching_phrase(phrase)
-                    target = existing or phrase
-                    imported[target] = imported.get(target, 0) + votes
-
+                    raw_counts[phrase] += votes
+
+            # Merge near-duplicates once over the distinct imported phrases instead of per line.
+            imported: Counter[str] = Counter()
+            merged_into: Dict[str, str] = {}
+            index = PhraseIndex()
+            for phrase, votes in raw_counts.items():
+                target = index.match(phrase)
+                if target is None:
+                    target = phrase
+                    index.add(phrase)
+                merged_into[phrase] = target
+                imported[target] += votes
+
+            self._vote_generation += 1
             self.vote_counts = imported
             self.user_votes = {
-                username: phrase
+                username: merged_into.get(phrase, phrase)
                 for username, phrase in imported_user_votes.items()
-                if phrase in self.vote_counts and self.vote_counts.get(phrase, 0) > 0
+                if self.vote_counts[merged_into.get(phrase, phrase)] > 0
             }
 
+            self._rebuild_user_index()
+
             for phrase in self.user_votes.values():
                 if phrase not in self.vote_counts:
                     self.vote_counts[phrase] = 1
+            self._rebuild_phrase_index()
 
             self.refresh_table_from_votes()
             self.set_status(
@@ -667,21 +1048,18 @@ class App:
             editor.destroy()
 
             if col == "#1":
-                phrase_new = self.normalize_phrase(new_value)
+                phrase_new = normalize_phrase(new_value)
                 if not phrase_new:
                     return
                 if phrase_new != phrase_old:
-                    self.vote_counts.pop(phrase_old, None)
+                    self._drop_phrase(phrase_old)
                     matched_phrase = self.find_matching_phrase(phrase_new, ignore_phrase=phrase_old)
                     target_phrase = matched_phrase or phrase_new
-                    self.vote_counts[target_phrase] = self.vote_counts.get(target_phrase, 0) + votes_old
+                    self._set_phrase_votes(target_phrase, self.vote_counts[target_phrase] + votes_old)
             elif col == "#2":
                 votes_new = self.safe_int(new_value, votes_old)
                 if phrase_old in self.vote_counts:
-                    if votes_new <= 0:
-                        self.vote_counts.pop(phrase_old, None)
-                    else:
-                        self.vote_counts[phrase_old] = votes_new
+                    self._set_phrase_votes(phrase_old, votes_new)
 
             self.refresh_table_from_votes()
 
@@ -697,9 +1075,15 @@ class App:
         self.spin_velocity += random.uniform(18, 28)
         self.spin_velocity = min(self.spin_velocity, 120.0)
         self.spinning = True
+        self._wheel_dirty = True
 
     def update_spin_state(self) -> None:
-        if self.spinning or self.spin_velocity > 0:
+        moving = self.spinning or self.spin_velocity > 0
+        if not moving and not self._wheel_dirty:
+            self.root.after(IDLE_POLL_MS, self.update_spin_state)
+            return
+
+        if moving:
             self.rotation += self.spin_velocity
             self.spin_velocity *= 0.985
 
@@ -709,10 +1093,11 @@ class App:
 
             self.wheel_canvas.set_rotation(self.rotation)
 
+        self._wheel_dirty = False
         current_phrase, current_voter = self.pointer_details()
         self.wheel_canvas.set_current_info(current_phrase, current_voter)
 
-        self.root.after(16, self.update_spin_state)
+        self.root.after(SPIN_FRAME_MS if moving else IDLE_POLL_MS, self.update_spin_state)
 
     @staticmethod
     def safe_int(text: str, default: int) -> int:
@@ -724,6 +1109,7 @@ class App:
     def on_close(self) -> None:
         if self.irc_client:
             self.irc_client.stop()
+        self._vote_in.put(None)
         self.root.destroy()
 
 